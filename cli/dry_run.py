@@ -1,9 +1,14 @@
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.run_estimator import RunEstimate
 
 class DryRunManager:
     def __init__(self, logger: logging.Logger,dry_run: bool = False):
         self._dry_run_mode = dry_run
         self.logger = logger
+        self._planned_actions = 0
 
     def execute(self, description: str, func: callable, *args, **kwargs):
         """
@@ -14,10 +19,32 @@ class DryRunManager:
         """
         if self._dry_run_mode:
             self.logger.dry_run(f"Would execute: {description}")
+            self._planned_actions += 1
             return None
         else:
             return func(*args, **kwargs)
     
+    def report_estimate(self, estimate: "RunEstimate") -> None:
+        """
+        Logs the estimated cost of a real run.
+        """
+        self.logger.dry_run(
+            f"Estimate for {estimate.profiles} profile(s), "
+            f"{estimate.profiles_with_history} with recorded run stats (defaults used for the rest):"
+        )
+        self.logger.dry_run(f"  Planned requests: {estimate.planned_requests} (expected {estimate.expected_requests})")
+        self.logger.dry_run(f"  Expected comments: {estimate.expected_comments}")
+        self.logger.dry_run(
+            f"  Expected duration: {estimate.expected_duration_s:.1f}s "
+            f"({estimate.seconds_per_request:.2f}s per request, concurrency {estimate.concurrency})"
+        )
+        for output_format, size in estimate.output_bytes.items():
+            self.logger.dry_run(f"  Expected {output_format.value} output: {size} bytes")
+
+    @property
+    def planned_actions(self) -> int:
+        return self._planned_actions
+
     @property
     def is_dry_run(self) -> bool:
         return self._dry_run_mode
\ No newline at end of file
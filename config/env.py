@@ -2,6 +2,7 @@ from dotenv import dotenv_values
 
 from cli.config_print_mode import ConfigPrintMode
 from output.output_format import OutputFormat
+from output.output_compression import OutputCompression
 
 import config.exceptions as config
 
@@ -10,7 +11,10 @@ class EnvConfig:
     OPTIONAL = (
         "steamLoginSecure", "sessionid", "MAX_PAGINATION_DEPTH", 
         "request_delay_ms", "print_config_mode", "dry_run",
-        "output_format", "output_file"
+        "output_format", "output_file", "output_compression",
+        "shard_max_comments", "shard_max_bytes", "shard_workers",
+        "analytics", "analytics_top_authors", "analytics_bucket_seconds",
+        "store_db", "profiles_file", "crawl_request_budget", "stats_file"
         )
     SENSITIVE_KEYS = ("steamLoginSecure", "sessionid")
 
@@ -29,6 +33,8 @@ class EnvConfig:
         for k, v in self._user_config.items():
             if k == "print_config_mode":
                 data[k] = v.value
+            elif k == "output_compression" and v is not None:
+                data[k] = v.value
             elif k in self.SENSITIVE_KEYS and self.print_config_mode == ConfigPrintMode.SAFE:
                 data[k] = "*****"
             else:
@@ -94,13 +100,46 @@ class EnvConfig:
                 self.dry_run = raw.lower() in ("1", "true", "yes", "on")
 
             case "output_format":
-                if raw.lower() not in ("json", "csv", "xml", "text"):
-                    raise config.ConfigError(f"Invalid output_format: {raw}. Must be one of json, csv, xml, text.")
+                if raw.lower() not in ("json", "csv", "xml", "text", "columnar"):
+                    raise config.ConfigError(f"Invalid output_format: {raw}. Must be one of json, csv, xml, text, columnar.")
                 self._user_config["output_format"] = raw.lower()
 
             case "output_file":
                 self._user_config["output_file"] = raw
 
+            case "output_compression":
+                self.output_compression = OutputCompression.parse(raw.lower())
+
+            case "shard_max_comments":
+                self.shard_max_comments = int(raw)
+
+            case "shard_max_bytes":
+                self.shard_max_bytes = int(raw)
+
+            case "shard_workers":
+                self.shard_workers = int(raw)
+
+            case "analytics":
+                self.analytics = raw.lower() in ("1", "true", "yes", "on")
+
+            case "analytics_top_authors":
+                self.analytics_top_authors = int(raw)
+
+            case "analytics_bucket_seconds":
+                self.analytics_bucket_seconds = int(raw)
+
+            case "store_db":
+                self._user_config["store_db"] = raw
+
+            case "profiles_file":
+                self._user_config["profiles_file"] = raw
+
+            case "crawl_request_budget":
+                self.crawl_request_budget = int(raw)
+
+            case "stats_file":
+                self._user_config["stats_file"] = raw
+
             case _:
                 pass
 
@@ -116,6 +155,17 @@ class EnvConfig:
         self._user_config["dry_run"] = self._normalize_bool("dry_run", False)
         self._user_config["output_format"] = self._normalize_output_format("output_format", OutputFormat.JSON)
         self._user_config["output_file"] = self._normalize_str("output_file", None)
+        self._user_config["output_compression"] = self._normalize_output_compression("output_compression", None)
+        self._user_config["shard_max_comments"] = self._normalize_int("shard_max_comments", 0)
+        self._user_config["shard_max_bytes"] = self._normalize_int("shard_max_bytes", 0)
+        self._user_config["shard_workers"] = self._normalize_int("shard_workers", 1)
+        self._user_config["analytics"] = self._normalize_bool("analytics", False)
+        self._user_config["analytics_top_authors"] = self._normalize_int("analytics_top_authors", 10)
+        self._user_config["analytics_bucket_seconds"] = self._normalize_int("analytics_bucket_seconds", 86400)
+        self._user_config["store_db"] = self._normalize_str("store_db", None)
+        self._user_config["profiles_file"] = self._normalize_str("profiles_file", None)
+        self._user_config["crawl_request_budget"] = self._normalize_int("crawl_request_budget", 1000)
+        self._user_config["stats_file"] = self._normalize_str("stats_file", None)
 
     def _normalize_str(self, key: str, default: str | None) -> str | None:
         raw = self._user_config.get(key, default)
@@ -171,11 +221,22 @@ class EnvConfig:
     def _normalize_output_format(self, key: str, default: OutputFormat) -> OutputFormat:
         raw = self._user_config.get(key, default)
 
-        if isinstance(raw, str) and raw.lower() in ("json", "csv", "xml", "text"):
+        if isinstance(raw, str) and raw.lower() in ("json", "csv", "xml", "text", "columnar"):
             return OutputFormat(raw.lower())
     
         return default
 
+    def _normalize_output_compression(self, key: str, default: OutputCompression | None) -> OutputCompression | None:
+        raw = self._user_config.get(key, default)
+
+        if isinstance(raw, OutputCompression):
+            return raw
+
+        if isinstance(raw, str) and raw.lower() in ("none", "gzip", "zstd"):
+            return OutputCompression(raw.lower())
+
+        return default
+
     @property
     def steam_url(self) -> str:
         return self._user_config.get("steam_url", "")
@@ -276,6 +337,140 @@ class EnvConfig:
             raise config.ConfigError("output_file must be a string or None.")
         self._user_config["output_file"] = value
 
+    @property
+    def output_compression(self) -> OutputCompression | None:
+        return self._user_config.get("output_compression", None)
+
+    @output_compression.setter
+    def output_compression(self, value: OutputCompression | None) -> None:
+        if not (isinstance(value, OutputCompression) or value is None):
+            raise config.ConfigError("output_compression must be an instance of OutputCompression enum or None.")
+        self._user_config["output_compression"] = value
+
+    @property
+    def shard_max_comments(self) -> int:
+        return self._user_config.get("shard_max_comments") or 0
+
+    @shard_max_comments.setter
+    def shard_max_comments(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("shard_max_comments must be an integer.")
+
+        if value < 0:
+            raise config.ConfigError("shard_max_comments cannot be negative.")
+
+        self._user_config["shard_max_comments"] = value
+
+    @property
+    def shard_max_bytes(self) -> int:
+        return self._user_config.get("shard_max_bytes") or 0
+
+    @shard_max_bytes.setter
+    def shard_max_bytes(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("shard_max_bytes must be an integer.")
+
+        if value < 0:
+            raise config.ConfigError("shard_max_bytes cannot be negative.")
+
+        self._user_config["shard_max_bytes"] = value
+
+    @property
+    def shard_workers(self) -> int:
+        return self._user_config.get("shard_workers") or 1
+
+    @shard_workers.setter
+    def shard_workers(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("shard_workers must be an integer.")
+
+        if value <= 0:
+            raise config.ConfigError("shard_workers must be a positive integer.")
+
+        self._user_config["shard_workers"] = value
+
+    @property
+    def analytics(self) -> bool:
+        return self._user_config.get("analytics") or False
+
+    @analytics.setter
+    def analytics(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise config.ConfigError("analytics must be a boolean.")
+        self._user_config["analytics"] = value
+
+    @property
+    def analytics_top_authors(self) -> int:
+        return self._user_config.get("analytics_top_authors") or 10
+
+    @analytics_top_authors.setter
+    def analytics_top_authors(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("analytics_top_authors must be an integer.")
+
+        if value <= 0:
+            raise config.ConfigError("analytics_top_authors must be a positive integer.")
+
+        self._user_config["analytics_top_authors"] = value
+
+    @property
+    def analytics_bucket_seconds(self) -> int:
+        return self._user_config.get("analytics_bucket_seconds") or 86400
+
+    @analytics_bucket_seconds.setter
+    def analytics_bucket_seconds(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("analytics_bucket_seconds must be an integer.")
+
+        if value <= 0:
+            raise config.ConfigError("analytics_bucket_seconds must be a positive integer.")
+
+        self._user_config["analytics_bucket_seconds"] = value
+
+    @property
+    def store_db(self) -> str | None:
+        return self._user_config.get("store_db", None)
+
+    @store_db.setter
+    def store_db(self, value: str | None) -> None:
+        if not (isinstance(value, str) or value is None):
+            raise config.ConfigError("store_db must be a string or None.")
+        self._user_config["store_db"] = value
+
+    @property
+    def profiles_file(self) -> str | None:
+        return self._user_config.get("profiles_file", None)
+
+    @profiles_file.setter
+    def profiles_file(self, value: str | None) -> None:
+        if not (isinstance(value, str) or value is None):
+            raise config.ConfigError("profiles_file must be a string or None.")
+        self._user_config["profiles_file"] = value
+
+    @property
+    def crawl_request_budget(self) -> int:
+        return self._user_config.get("crawl_request_budget") or 1000
+
+    @crawl_request_budget.setter
+    def crawl_request_budget(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise config.ConfigError("crawl_request_budget must be an integer.")
+
+        if value <= 0:
+            raise config.ConfigError("crawl_request_budget must be a positive integer.")
+
+        self._user_config["crawl_request_budget"] = value
+
+    @property
+    def stats_file(self) -> str | None:
+        return self._user_config.get("stats_file", None)
+
+    @stats_file.setter
+    def stats_file(self, value: str | None) -> None:
+        if not (isinstance(value, str) or value is None):
+            raise config.ConfigError("stats_file must be a string or None.")
+        self._user_config["stats_file"] = value
+
     @property
     def cookies_enabled(self) -> bool:
         return self._cookies_enabled
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class AuthorCount:
+    author_name: str
+    comments: int
+
+@dataclass(frozen=True)
+class HistogramBucket:
+    start_timestamp: int
+    comments: int
+
+@dataclass(frozen=True)
+class Burst:
+    start_timestamp: int
+    end_timestamp: int
+    comments: int
+
+@dataclass(frozen=True)
+class GapStats:
+    min_seconds: int
+    max_seconds: int
+    mean_seconds: float
+    median_seconds: float
+
+@dataclass(frozen=True)
+class AnalyticsReport:
+    total_comments: int
+    unique_authors: int
+    first_timestamp: int | None
+    last_timestamp: int | None
+    bucket_seconds: int
+    top_authors: list[AuthorCount]
+    histogram: list[HistogramBucket]
+    bursts: list[Burst]
+    gaps: GapStats | None
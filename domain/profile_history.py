@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ProfileHistory:
+    profile_url: str
+    last_attempt: int | None = None
+    last_success: int | None = None
+    newest_timestamp: int | None = None
+    new_comments_per_day: float = 0.0
+    consecutive_failures: int = 0
+    requests_last_run: int = 0
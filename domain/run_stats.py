@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+@dataclass
+class RunStats:
+    runs: int = 0
+    requests: int = 0
+    request_seconds: float = 0.0
+    comments: int = 0
+    text_bytes: int = 0
+    output_bytes: dict[str, int] = field(default_factory=dict)
+    output_comments: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def total(cls, stats: Iterable["RunStats"]) -> "RunStats":
+        result = cls()
+
+        for item in stats:
+            result.runs += item.runs
+            result.requests += item.requests
+            result.request_seconds += item.request_seconds
+            result.comments += item.comments
+            result.text_bytes += item.text_bytes
+            for key, value in item.output_bytes.items():
+                result.output_bytes[key] = result.output_bytes.get(key, 0) + value
+            for key, value in item.output_comments.items():
+                result.output_comments[key] = result.output_comments.get(key, 0) + value
+
+        return result
+
+    @property
+    def average_latency(self) -> float | None:
+        if not self.requests:
+            return None
+        return self.request_seconds / self.requests
+
+    @property
+    def requests_per_run(self) -> float | None:
+        if not self.runs:
+            return None
+        return self.requests / self.runs
+
+    @property
+    def comments_per_request(self) -> float | None:
+        if not self.requests:
+            return None
+        return self.comments / self.requests
+
+    @property
+    def average_text_bytes(self) -> float | None:
+        if not self.comments:
+            return None
+        return self.text_bytes / self.comments
+
+    def bytes_per_comment(self, output_format: str) -> float | None:
+        comments = self.output_comments.get(output_format)
+        if not comments:
+            return None
+        return self.output_bytes[output_format] / comments
+
+
+@dataclass
+class ProfileRunStats:
+    """
+    Statistics of one profile, kept apart for full crawls and for incremental
+    recrawls, which stop at comments seen before and cost only a few requests.
+    """
+    full: RunStats = field(default_factory=RunStats)
+    incremental: RunStats = field(default_factory=RunStats)
+
+    def for_run(self, incremental: bool) -> RunStats:
+        return self.incremental if incremental else self.full
@@ -2,10 +2,12 @@ from dataclasses import dataclass
 
 from domain.comment import Comment
 from domain.comment_status import CommentStatus
+from domain.analytics_report import AnalyticsReport
 
 @dataclass(frozen=True)
 class ScrapeResult:
     profile_name: str
     profile_url: str
     account_comments: list[Comment]
-    comments_status: CommentStatus
\ No newline at end of file
+    comments_status: CommentStatus
+    analytics: AnalyticsReport | None = None
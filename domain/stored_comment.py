@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from domain.comment import Comment
+
+@dataclass(frozen=True)
+class StoredComment:
+    profile_url: str
+    comment: Comment
@@ -1,14 +1,30 @@
 import sys
 import logging
 import argparse
+from dataclasses import replace
+from datetime import datetime
 
 from output.output_format import OutputFormat
+from output.output_compression import OutputCompression
 from services.comment_loader import CommentLoader
+from services.comment_analytics import CommentAnalytics
+from services.batch_crawler import BatchCrawler
+from services.recrawl_scheduler import RecrawlScheduler
+from services.run_estimator import RunEstimator
 from domain.scrape_result import ScrapeResult
+from domain.analytics_report import AnalyticsReport
 from config.env import EnvConfig
 from cli.dry_run import DryRunManager
 from cli.config_print_mode import ConfigPrintMode
 from output.output_manager import OutputManager
+from output.columnar_reader import ColumnarReader
+from output.exceptions import OutputError
+from steam_client.steam_client import SteamClient
+from storage.comment_store import CommentStore
+from storage.crawl_history import CrawlHistory
+from storage.run_stats_file import RunStatsFile
+from domain.run_stats import ProfileRunStats
+from storage.exceptions import StoreError
 
 from steam_client.exceptions import SteamRequestFailed, MaxPaginationDepthExceeded
 import config.exceptions as config_exceptions
@@ -17,6 +33,14 @@ import cli.exceptions as cli_exceptions
 DRY_RUN_LEVEL = 25
 CONFIG_LEVEL = 15
 
+def parse_time(raw: str) -> int:
+    if raw.isdigit():
+        return int(raw)
+    try:
+        return int(datetime.fromisoformat(raw).timestamp())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a unix timestamp or ISO date, got '{raw}'")
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Steam comment loader")
     parser.add_argument("--steam-login-secure", type=str, required=False, help="Steam login secure cookie value")
@@ -31,13 +55,37 @@ def parse_args():
     parser.add_argument("--dry-run", action="store_true", help="Simulate actions without sending HTTP requests")
     parser.add_argument("--no-dry-run", action="store_true", help="Explicitly disables dry-run mode, if its enabled in config")
     parser.add_argument(
-        "--output-format", choices=["json", "csv", "xml", "text"], 
+        "--output-format", choices=["json", "csv", "xml", "text", "columnar"], 
         required=False, help="Output format for scraped comments"
         )
     parser.add_argument(
         "--output-file", type=str, required=False, default=None, 
         help="Path to the output file where scraped comments will be saved"
         )
+    parser.add_argument(
+        "--output-compression", choices=[c.value for c in OutputCompression], required=False,
+        help="Compression of the output file. Inferred from the file extension (.gz, .zst) if omitted"
+        )
+    parser.add_argument("--shard-max-comments", type=int, required=False, help="Split output into shards of at most N comments")
+    parser.add_argument("--shard-max-bytes", type=int, required=False, help="Split output into shards of roughly N uncompressed bytes")
+    parser.add_argument("--shard-workers", type=int, required=False, help="Number of worker processes writing output shards")
+    parser.add_argument("--analytics", action="store_true", help="Compute comment analytics and include them in the output")
+    parser.add_argument("--analytics-top-authors", type=int, required=False, help="Number of top authors reported by analytics")
+    parser.add_argument("--analytics-bucket-seconds", type=int, required=False, help="Histogram bucket size in seconds")
+    parser.add_argument(
+        "--analyze-file", type=str, required=False,
+        help="Compute analytics for a stored columnar export and exit, without fetching anything"
+        )
+    parser.add_argument("--store-db", type=str, required=False, help="Path to the SQLite comment store to save comments into")
+    parser.add_argument("--query-author", type=str, required=False, help="Query the comment store for comments by this author and exit")
+    parser.add_argument("--query-text", type=str, required=False, help="Query the comment store for comments containing this phrase and exit")
+    parser.add_argument("--query-since", type=parse_time, required=False, help="Only query comments at or after this unix timestamp or ISO date")
+    parser.add_argument("--query-until", type=parse_time, required=False, help="Only query comments before this unix timestamp or ISO date")
+    parser.add_argument("--query-profile", type=str, required=False, help="Only query comments of this profile URL")
+    parser.add_argument("--query-limit", type=int, required=False, help="Maximum number of query results")
+    parser.add_argument("--profiles-file", type=str, required=False, help="File with one profile URL per line to crawl in batch mode")
+    parser.add_argument("--crawl-request-budget", type=int, required=False, help="Maximum number of requests spent by a batch crawl")
+    parser.add_argument("--stats-file", type=str, required=False, help="JSON file recording run statistics used by dry-run estimates")
     
     return parser.parse_args()
 
@@ -88,6 +136,117 @@ def extract_args(args, env_config: EnvConfig) -> None:
         env_config.output_format = OutputFormat.parse(args.output_format)
     if args.output_file:
         env_config.output_file = args.output_file
+    if args.output_compression:
+        env_config.output_compression = OutputCompression.parse(args.output_compression)
+    if args.shard_max_comments:
+        env_config.shard_max_comments = args.shard_max_comments
+    if args.shard_max_bytes:
+        env_config.shard_max_bytes = args.shard_max_bytes
+    if args.shard_workers:
+        env_config.shard_workers = args.shard_workers
+    if args.analytics:
+        env_config.analytics = True
+    if args.analytics_top_authors:
+        env_config.analytics_top_authors = args.analytics_top_authors
+    if args.analytics_bucket_seconds:
+        env_config.analytics_bucket_seconds = args.analytics_bucket_seconds
+    if args.store_db:
+        env_config.store_db = args.store_db
+    if args.profiles_file:
+        env_config.profiles_file = args.profiles_file
+    if args.crawl_request_budget:
+        env_config.crawl_request_budget = args.crawl_request_budget
+    if args.stats_file:
+        env_config.stats_file = args.stats_file
+
+def load_run_stats(env_config: EnvConfig) -> dict[str, ProfileRunStats]:
+    return RunStatsFile(env_config.stats_file).load() if env_config.stats_file else {}
+
+def is_query(args) -> bool:
+    return any(
+        value is not None for value in (
+            args.query_author, args.query_text, args.query_since,
+            args.query_until, args.query_profile, args.query_limit
+        )
+    )
+
+def read_profiles_file(path: str) -> list[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    except OSError as e:
+        raise config_exceptions.ConfigError(f"Failed to read profiles file: {path}") from e
+
+def crawl_batch(env_config: EnvConfig, dry_run_manager: DryRunManager, logger: logging.Logger) -> None:
+    if not env_config.store_db:
+        raise config_exceptions.ConfigError("Batch crawling requires store_db to keep comments and crawl history.")
+
+    profile_urls = [SteamClient.normalize_profile_url(url) for url in read_profiles_file(env_config.profiles_file)]
+    scheduler = RecrawlScheduler(
+        request_budget=env_config.crawl_request_budget,
+        max_pages=env_config.max_pagination_depth
+    )
+
+    if dry_run_manager.is_dry_run:
+        with CrawlHistory(env_config.store_db, read_only=True) as history:
+            plan = BatchCrawler(env_config, dry_run_manager, scheduler, history, None, logger).plan(profile_urls)
+        for entry in plan:
+            logger.dry_run(f"Would crawl '{entry.profile_url}' (~{entry.estimated_requests} requests)")
+        estimate = RunEstimator(env_config, load_run_stats(env_config)).estimate(
+            {entry.profile_url: entry.estimated_requests for entry in plan},
+            incremental={entry.profile_url for entry in plan if entry.stop_at_timestamp is not None}
+        )
+        dry_run_manager.report_estimate(estimate)
+        return
+
+    with CommentStore(env_config.store_db) as store, CrawlHistory(env_config.store_db) as history:
+        run_stats = RunStatsFile(env_config.stats_file) if env_config.stats_file else None
+        crawler = BatchCrawler(
+            env_config, dry_run_manager, scheduler, history, store, logger, run_stats
+        )
+        spent = crawler.run(profile_urls)
+
+    logger.info(f"Batch crawl finished, {spent} of {env_config.crawl_request_budget} requests spent.")
+
+def query_store(args, env_config: EnvConfig, logger: logging.Logger) -> None:
+    if not env_config.store_db:
+        raise cli_exceptions.MissingCLIArgument("Querying requires --store-db or store_db in the env file.")
+
+    with CommentStore(env_config.store_db) as store:
+        results = store.search(
+            author=args.query_author,
+            text=args.query_text,
+            since=args.query_since,
+            until=args.query_until,
+            profile_url=SteamClient.normalize_profile_url(args.query_profile) if args.query_profile else None,
+            limit=args.query_limit
+        )
+
+    logger.info(f"Query matched {len(results)} comments.")
+    for result in results:
+        comment = result.comment
+        print(
+            f"At {datetime.fromtimestamp(comment.timestamp)} user named {comment.author_name} "
+            f"commented on {result.profile_url}: {comment.text}"
+        )
+
+def build_output_manager(env_config: EnvConfig) -> OutputManager:
+    return OutputManager(
+        format=env_config.output_format,
+        file_path=env_config.output_file,
+        compression=env_config.output_compression,
+        shard_max_comments=env_config.shard_max_comments,
+        shard_max_bytes=env_config.shard_max_bytes,
+        shard_workers=env_config.shard_workers,
+        measure_size=bool(env_config.stats_file)
+    )
+
+def analyze_file(path: str, env_config: EnvConfig) -> AnalyticsReport:
+    with ColumnarReader(path) as reader:
+        return CommentAnalytics.from_columnar(reader).report(
+            top_n=env_config.analytics_top_authors,
+            bucket_seconds=env_config.analytics_bucket_seconds
+        )
 
 def main() -> int:
     logger = setup_logger()
@@ -121,18 +280,38 @@ def main() -> int:
             logger.config("Configuration loaded successfully.")
             logger.info("Starting comment loading process.")
 
+        if is_query(args):
+            query_store(args, env_config, logger)
+            return 0
+
+        if args.analyze_file:
+            if env_config.output_format in (OutputFormat.CSV, OutputFormat.COLUMNAR):
+                raise cli_exceptions.CLIArgumentConflict(
+                    f"--analyze-file cannot output analytics as {env_config.output_format.value}; use json, xml or text."
+                )
+            logger.info(f"Analyzing stored comments from '{args.analyze_file}'.")
+            build_output_manager(env_config).output_analytics(analyze_file(args.analyze_file, env_config))
+            return 0
+
         if env_config.cookies_enabled == False:
             logger.warning("Proceeding without cookies may lead to incomplete data or request failures.")
 
         dry_run_manager: DryRunManager = DryRunManager(logger=logger, dry_run=env_config.dry_run)
+
+        if env_config.profiles_file:
+            crawl_batch(env_config, dry_run_manager, logger)
+            return 0
+
         comment_loader: CommentLoader = CommentLoader(env_config, dry_run_manager)
+        output_manager: OutputManager = build_output_manager(env_config)
         scrape_result: ScrapeResult = comment_loader.load_all()
-        output_manager: OutputManager = OutputManager(
-            format=env_config.output_format,
-            file_path=env_config.output_file
-        )
 
         if env_config.dry_run:
+            # The dry-run pagination skips the final re-fetch of page 1 for the profile name.
+            estimate = RunEstimator(env_config, load_run_stats(env_config)).estimate(
+                {env_config.steam_url: dry_run_manager.planned_actions + 1}
+            )
+            dry_run_manager.report_estimate(estimate)
             logger.dry_run("Dry-run mode enabled: no requests were sent.")
             logger.dry_run("Exiting.")
             return 0
@@ -140,8 +319,43 @@ def main() -> int:
         logger.info(f"Comments loaded successfully for profile '{scrape_result.profile_name}' ({scrape_result.profile_url}).")
         logger.info(f"Total comments loaded: {len(scrape_result.account_comments)}")
 
+        if comment_loader.duplicates_dropped:
+            logger.info(
+                f"Dropped {comment_loader.duplicates_dropped} duplicate comments from "
+                f"{comment_loader.shifted_pages} shifted pages; re-fetched the newest pages for comments posted meanwhile."
+            )
+
+        transfer_stats = comment_loader.transfer_stats
+        logger.info(
+            f"Transferred {transfer_stats.compressed_bytes} bytes over {transfer_stats.requests} requests "
+            f"({transfer_stats.decompressed_bytes} bytes decompressed, ratio {transfer_stats.compression_ratio:.2f}x)"
+        )
+
+        if env_config.analytics:
+            report = CommentAnalytics.from_scrape_result(scrape_result).report(
+                top_n=env_config.analytics_top_authors,
+                bucket_seconds=env_config.analytics_bucket_seconds
+            )
+            scrape_result = replace(scrape_result, analytics=report)
+            logger.info(f"Analytics computed: {report.unique_authors} unique authors, {len(report.bursts)} bursts.")
+
+        if (env_config.shard_max_comments or env_config.shard_max_bytes) and not env_config.output_file:
+            logger.warning("Output sharding requires --output-file; printing unsharded output to console.")
+
         output_manager.output_data(scrape_result)
 
+        if env_config.stats_file:
+            stats_file = RunStatsFile(env_config.stats_file)
+            stats_file.save(RunEstimator.record_run(
+                stats_file.load(), comment_loader.transfer_stats, scrape_result,
+                env_config.output_format, output_manager.serialized_size
+            ))
+
+        if env_config.store_db:
+            with CommentStore(env_config.store_db) as store:
+                inserted = store.store(scrape_result)
+            logger.info(f"Stored {inserted} new comments in '{env_config.store_db}'.")
+
         logger.info("Output completed successfully.")
 
     except SteamRequestFailed as e:
@@ -156,6 +370,15 @@ def main() -> int:
     except cli_exceptions.CLIArgumentConflict as e:
         logger.error(f"CLI argument error: {e}")
         return 5
+    except cli_exceptions.MissingCLIArgument as e:
+        logger.error(f"CLI argument error: {e}")
+        return 5
+    except OutputError as e:
+        logger.error(f"Output error: {e}")
+        return 6
+    except StoreError as e:
+        logger.error(f"Comment store error: {e}")
+        return 7
     except Exception as e:
         logger.error("Program unexpectedly crashed")
         return 1
@@ -0,0 +1,38 @@
+"""
+Layout of the built-in columnar binary format.
+
+    header   MAGIC (8 bytes) | version (uint16) | reserved (6 bytes)
+    columns  8-byte aligned blocks, described by the footer
+    footer   UTF-8 JSON metadata
+    trailer  footer offset (uint64) | footer length (uint64) | MAGIC
+
+Columns:
+    timestamps      int64[rows]
+    author_ids      uint32[rows], indexes into the author dictionary
+    author_offsets  uint64[authors + 1], offsets into author_data
+    author_data     UTF-8 bytes of the dictionary-encoded author names
+    text_offsets    uint64[rows + 1], offsets into text_data
+    text_data       UTF-8 bytes of all comment texts
+
+Numeric columns are stored in the byte order recorded in the footer.
+"""
+import struct
+
+MAGIC = b"STMCOL\x00\x01"
+VERSION = 1
+ALIGNMENT = 8
+
+HEADER = struct.Struct("<8sH6x")
+TRAILER = struct.Struct("<QQ8s")
+
+COLUMN_TYPECODES = {
+    "timestamps": "q",
+    "author_ids": "I",
+    "author_offsets": "Q",
+    "author_data": "B",
+    "text_offsets": "Q",
+    "text_data": "B",
+}
+
+def padding(length: int) -> int:
+    return -length % ALIGNMENT
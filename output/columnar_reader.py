@@ -0,0 +1,145 @@
+import json
+import mmap
+import sys
+from array import array
+from typing import Iterator
+
+from domain.comment import Comment
+from domain.comment_status import CommentStatus
+from domain.scrape_result import ScrapeResult
+from output import columnar_format as layout
+from output.exceptions import ColumnarFormatError
+
+class ColumnarReader:
+    """
+    Memory-mapped reader for files written in the columnar output format.
+
+    Numeric columns are exposed as memoryviews over the mapped file, so no
+    data is copied until individual values are accessed. Release any views
+    taken from the reader before closing it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+        try:
+            self._file = open(path, "rb")
+        except OSError as e:
+            raise ColumnarFormatError(f"Failed to open columnar file '{path}': {e.strerror}") from e
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:
+            self._file.close()
+            raise ColumnarFormatError(f"Failed to memory-map '{path}', the file may be empty") from e
+
+        self._view = memoryview(self._mmap)
+        self._columns: dict[str, memoryview] = {}
+
+        try:
+            self._meta = self._read_footer()
+            self._columns = {
+                name: self._column(name, typecode) for name, typecode in layout.COLUMN_TYPECODES.items()
+            }
+            self._authors = [
+                self._decode(self._columns["author_data"], self._columns["author_offsets"], i)
+                for i in range(self._meta["authors"])
+            ]
+        except ColumnarFormatError:
+            self.close()
+            raise
+        except Exception as e:
+            self.close()
+            raise ColumnarFormatError(f"'{path}' is a corrupt columnar file") from e
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._meta["rows"]
+
+    def __iter__(self) -> Iterator[Comment]:
+        for i in range(len(self)):
+            yield self.comment(i)
+
+    @property
+    def profile_name(self) -> str:
+        return self._meta["profile_name"]
+
+    @property
+    def profile_url(self) -> str:
+        return self._meta["profile_url"]
+
+    @property
+    def comments_status(self) -> CommentStatus:
+        return CommentStatus(self._meta["comments_status"])
+
+    @property
+    def timestamps(self) -> memoryview:
+        return self._columns["timestamps"]
+
+    @property
+    def author_ids(self) -> memoryview:
+        return self._columns["author_ids"]
+
+    @property
+    def authors(self) -> list[str]:
+        return self._authors
+
+    def author(self, row: int) -> str:
+        return self._authors[self._columns["author_ids"][row]]
+
+    def text(self, row: int) -> str:
+        return self._decode(self._columns["text_data"], self._columns["text_offsets"], row)
+
+    def comment(self, row: int) -> Comment:
+        return Comment(self.author(row), self._columns["timestamps"][row], self.text(row))
+
+    def to_scrape_result(self) -> ScrapeResult:
+        return ScrapeResult(self.profile_name, self.profile_url, list(self), self.comments_status)
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+        self._columns = {}
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def _read_footer(self) -> dict:
+        size = len(self._view)
+        if size < layout.HEADER.size + layout.TRAILER.size:
+            raise ColumnarFormatError(f"'{self._path}' is too small to be a columnar file")
+
+        magic, version = layout.HEADER.unpack_from(self._view, 0)
+        footer_offset, footer_length, trailer_magic = layout.TRAILER.unpack_from(self._view, size - layout.TRAILER.size)
+
+        if magic != layout.MAGIC or trailer_magic != layout.MAGIC:
+            raise ColumnarFormatError(f"'{self._path}' is not a columnar file (compressed output cannot be memory-mapped)")
+        if version != layout.VERSION:
+            raise ColumnarFormatError(f"Unsupported columnar format version: {version}")
+
+        return json.loads(bytes(self._view[footer_offset:footer_offset + footer_length]).decode("utf-8"))
+
+    def _column(self, name: str, typecode: str) -> memoryview:
+        meta = self._meta["columns"][name]
+        raw = self._view[meta["offset"]:meta["offset"] + meta["length"]]
+
+        if typecode == "B":
+            return raw
+
+        if self._meta["byteorder"] != sys.byteorder:
+            # Foreign byte order cannot be viewed in place, fall back to a swapped copy.
+            values = array(typecode, raw)
+            values.byteswap()
+            raw.release()
+            return memoryview(values)
+
+        return raw.cast(typecode)
+
+    @staticmethod
+    def _decode(data: memoryview, offsets: memoryview, index: int) -> str:
+        return bytes(data[offsets[index]:offsets[index + 1]]).decode("utf-8")
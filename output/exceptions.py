@@ -0,0 +1,5 @@
+class OutputError(Exception):
+    pass
+
+class ColumnarFormatError(OutputError):
+    pass
@@ -0,0 +1,28 @@
+from enum import Enum
+
+from config.exceptions import ConfigError
+
+class OutputCompression(Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @classmethod
+    def parse(cls, raw: str) -> "OutputCompression":
+        try:
+            return cls(raw)
+        except ValueError:
+            raise ConfigError("output_compression must be one of: none, gzip, zstd")
+
+    @classmethod
+    def from_path(cls, path: str | None) -> "OutputCompression":
+        if not path:
+            return cls.NONE
+
+        lowered = path.lower()
+        if lowered.endswith((".gz", ".gzip")):
+            return cls.GZIP
+        if lowered.endswith((".zst", ".zstd")):
+            return cls.ZSTD
+
+        return cls.NONE
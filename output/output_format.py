@@ -7,10 +7,15 @@ class OutputFormat(Enum):
     CSV = "csv"
     XML = "xml"
     TEXT = "text"
+    COLUMNAR = "columnar"
 
     @classmethod
     def parse(cls, raw: str) -> "OutputFormat":
         try:
             return cls(raw)
         except ValueError:
-            raise ConfigError("output_format must be one of: json, csv, xml, text")
\ No newline at end of file
+            raise ConfigError("output_format must be one of: json, csv, xml, text, columnar")
+
+    @property
+    def is_binary(self) -> bool:
+        return self is OutputFormat.COLUMNAR
\ No newline at end of file
@@ -1,5 +1,26 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+from itertools import repeat
+from typing import IO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from config.exceptions import ConfigError
 from domain.scrape_result import ScrapeResult
+from domain.analytics_report import AnalyticsReport
 from output.output_format import OutputFormat
+from output.output_compression import OutputCompression
+from output.sharding import Sharder, ShardInfo
 import output.serializers as serializers
 
 class OutputManager:
@@ -8,13 +29,79 @@ class OutputManager:
         OutputFormat.CSV: serializers.CSVSerializer,
         OutputFormat.XML: serializers.XMLSerializer,
         OutputFormat.TEXT: serializers.TextSerializer,
+        OutputFormat.COLUMNAR: serializers.ColumnarSerializer,
+    }
+    _analytics_serializers = {
+        OutputFormat.JSON: serializers.JSONSerializer,
+        OutputFormat.XML: serializers.XMLSerializer,
+        OutputFormat.TEXT: serializers.TextSerializer,
     }
+    _CHUNK_SIZE = 1024 * 1024
 
-    def __init__(self, format: OutputFormat = OutputFormat.JSON, file_path: str | None = None):
+    def __init__(
+            self, format: OutputFormat = OutputFormat.JSON, file_path: str | None = None,
+            compression: OutputCompression | None = None, shard_max_comments: int = 0,
+            shard_max_bytes: int = 0, shard_workers: int = 1, measure_size: bool = False
+            ):
         self.format = format
         self.file_path = file_path
+        self.compression = compression if compression is not None else OutputCompression.from_path(file_path)
+        if self.file_path and self.compression == OutputCompression.ZSTD and zstandard is None:
+            raise ConfigError("zstd output compression requires the 'zstandard' package")
+        self.shard_max_comments = shard_max_comments
+        self.shard_max_bytes = shard_max_bytes
+        self.shard_workers = max(1, shard_workers)
+        self.measure_size = measure_size
+        self._serialized_size = 0
+        self._size_lock = threading.Lock()
+
+    @property
+    def serialized_size(self) -> int:
+        """
+        Uncompressed size in bytes of everything serialized so far, only
+        counted when measure_size is set.
+        """
+        return self._serialized_size
+
+    @property
+    def sharding_enabled(self) -> bool:
+        return bool(self.file_path) and bool(self.shard_max_comments or self.shard_max_bytes)
 
     def output_data(self, data: ScrapeResult) -> None:
+        if self.sharding_enabled:
+            self._output_shards(data)
+            return
+
+        self._emit(self.serialize(data))
+
+    def output_analytics(self, report: AnalyticsReport) -> None:
+        """
+        Outputs an analytics report on its own, without comments.
+        Only json, xml and text output can hold a standalone report.
+
+        :param report: AnalyticsReport - report to output
+        """
+        serializer = self._analytics_serializers.get(self.format)
+        if serializer is None:
+            raise ValueError(f"Analytics cannot be output as '{self.format.value}'")
+
+        try:
+            serialized = serializer.serialize_analytics(report)
+        except Exception as e:
+            raise RuntimeError(f"Analytics serialization failed for format '{self.format}'") from e
+
+        self._emit(serialized)
+
+    def _emit(self, serialized: str | bytes) -> None:
+        if self.file_path:
+            self._write_to_file(serialized, self.file_path)
+        elif self.format.is_binary:
+            sys.stdout.buffer.write(serialized)
+            sys.stdout.buffer.flush()
+        else:
+            print(serialized)
+
+    def serialize(self, data: ScrapeResult) -> str | bytes:
         serializer = self._serializers[self.format]
 
         try:
@@ -22,14 +109,118 @@ class OutputManager:
         except Exception as e:
             raise RuntimeError(f"Serialization failed for format '{self.format}'") from e
 
-        if self.file_path:
-            self._write_to_file(serialized)
+        if self.measure_size:
+            with self._size_lock:
+                self._serialized_size += self._encoded_size(serialized)
+
+        return serialized
+
+    def _encoded_size(self, serialized: str | bytes) -> int:
+        if isinstance(serialized, bytes):
+            return len(serialized)
+
+        # Encode slice by slice so the size is known without a full UTF-8 copy of the output.
+        return sum(
+            len(serialized[start:start + self._CHUNK_SIZE].encode("utf-8"))
+            for start in range(0, len(serialized), self._CHUNK_SIZE)
+        )
+
+    def _output_shards(self, data: ScrapeResult) -> list[ShardInfo]:
+        chunks = Sharder.split(data.account_comments, self.shard_max_comments, self.shard_max_bytes)
+        paths = [Sharder.shard_path(self.file_path, index) for index in range(1, len(chunks) + 1)]
+        parts = [replace(data, account_comments=chunk, analytics=None) for chunk in chunks]
+
+        if self.shard_workers > 1 and len(parts) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.shard_workers, len(parts))) as executor:
+                results = list(executor.map(
+                    _write_shard, repeat(self.format), repeat(self.compression), repeat(self.measure_size), paths, parts
+                ))
         else:
-            print(serialized)
+            results = [
+                _write_shard(self.format, self.compression, self.measure_size, path, part)
+                for path, part in zip(paths, parts)
+            ]
+
+        shards = [shard for shard, _ in results]
+        with self._size_lock:
+            self._serialized_size += sum(size for _, size in results)
+
+        self._write_manifest(data, shards)
+        return shards
+
+    def _write_manifest(self, data: ScrapeResult, shards: list[ShardInfo]) -> None:
+        manifest = {
+            "profile_name": data.profile_name,
+            "profile_url": data.profile_url,
+            "format": self.format.value,
+            "compression": self.compression.value,
+            "total_rows": sum(shard.rows for shard in shards),
+            "shards": [
+                {**asdict(shard), "path": os.path.basename(shard.path)} for shard in shards
+            ],
+        }
+        if data.analytics:
+            manifest["analytics"] = asdict(data.analytics)
+        path = Sharder.manifest_path(self.file_path)
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=4, ensure_ascii=False)
+        except OSError as e:
+            raise IOError(f"Failed to write shard manifest to '{path}'") from e
 
-    def _write_to_file(self, content: str) -> None:
+    def _checksum(self, path: str) -> tuple[int, str]:
+        digest = hashlib.sha256()
+        size = 0
+
+        try:
+            with open(path, "rb") as f:
+                while block := f.read(self._CHUNK_SIZE):
+                    digest.update(block)
+                    size += len(block)
+        except OSError as e:
+            raise IOError(f"Failed to checksum output '{path}'") from e
+
+        return size, digest.hexdigest()
+
+    def _write_to_file(self, content: str | bytes, path: str) -> None:
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
+            with self._open_output(path) as f:
                 f.write(content)
         except OSError as e:
-            raise IOError(f"Failed to write output to '{self.file_path}'") from e
+            raise IOError(f"Failed to write output to '{path}'") from e
+
+    def _open_output(self, path: str) -> IO:
+        binary = self.format.is_binary
+
+        match self.compression:
+            case OutputCompression.GZIP:
+                return gzip.open(path, "wb") if binary else gzip.open(path, "wt", encoding="utf-8")
+            case OutputCompression.ZSTD:
+                raw = open(path, "wb")
+                writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+                return writer if binary else io.TextIOWrapper(writer, encoding="utf-8")
+            case _:
+                return open(path, "wb") if binary else open(path, "w", encoding="utf-8")
+
+
+def _write_shard(
+        format: OutputFormat, compression: OutputCompression, measure_size: bool, path: str, data: ScrapeResult
+        ) -> tuple[ShardInfo, int]:
+    """
+    Serializes, writes and checksums one shard.
+
+    Module level so that it can run in a worker process: serializers hold the
+    GIL, so threads would not write shards in parallel.
+
+    :param format: OutputFormat - output format of the shard
+    :param compression: OutputCompression - compression of the shard file
+    :param measure_size: bool - whether to count the uncompressed serialized size
+    :param path: str - shard file path
+    :param data: ScrapeResult - comments of the shard
+    :return: tuple[ShardInfo, int] - shard info and uncompressed serialized size
+    """
+    manager = OutputManager(format, path, compression, measure_size=measure_size)
+    manager._write_to_file(manager.serialize(data), path)
+    size, checksum = manager._checksum(path)
+    return ShardInfo(path=path, rows=len(data.account_comments), bytes=size, sha256=checksum), manager.serialized_size
@@ -2,10 +2,12 @@ from output.serializers.csv_serializer import CSVSerializer
 from output.serializers.json_serializer import JSONSerializer
 from output.serializers.xml_serializer import XMLSerializer
 from output.serializers.text_serializer import TextSerializer
+from output.serializers.columnar_serializer import ColumnarSerializer
 
 __all__ = [
     "CSVSerializer",
     "JSONSerializer",
     "XMLSerializer",
-    "TextSerializer"
+    "TextSerializer",
+    "ColumnarSerializer"
 ]
\ No newline at end of file
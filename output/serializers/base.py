@@ -4,8 +4,8 @@ from domain.scrape_result import ScrapeResult
 class OutputSerializer(ABC):
 
     @abstractmethod
-    def serialize(self, result: ScrapeResult) -> str:
+    def serialize(self, result: ScrapeResult) -> str | bytes:
         """
-        Convert ScrapeResult into a string representation.
+        Convert ScrapeResult into a string representation, or bytes for binary formats.
         """
         pass
@@ -0,0 +1,68 @@
+import io
+import json
+import sys
+from array import array
+
+from output.serializers.base import OutputSerializer
+from output import columnar_format as layout
+from domain.scrape_result import ScrapeResult
+
+class ColumnarSerializer(OutputSerializer):
+
+    @staticmethod
+    def serialize(data: ScrapeResult) -> bytes:
+        """
+        Convert ScrapeResult into the built-in columnar binary format.
+        """
+        comments = data.account_comments
+        author_index: dict[str, int] = {}
+        author_ids = array("I")
+        timestamps = array("q")
+        text_offsets = array("Q", [0])
+        text_data = bytearray()
+
+        for comment in comments:
+            author_ids.append(author_index.setdefault(comment.author_name, len(author_index)))
+            timestamps.append(comment.timestamp)
+            text_data += comment.text.encode("utf-8")
+            text_offsets.append(len(text_data))
+
+        author_offsets = array("Q", [0])
+        author_data = bytearray()
+        for author in author_index:
+            author_data += author.encode("utf-8")
+            author_offsets.append(len(author_data))
+
+        columns = {
+            "timestamps": timestamps.tobytes(),
+            "author_ids": author_ids.tobytes(),
+            "author_offsets": author_offsets.tobytes(),
+            "author_data": bytes(author_data),
+            "text_offsets": text_offsets.tobytes(),
+            "text_data": bytes(text_data),
+        }
+
+        output = io.BytesIO()
+        output.write(layout.HEADER.pack(layout.MAGIC, layout.VERSION))
+
+        column_meta = {}
+        for name, block in columns.items():
+            column_meta[name] = {"offset": output.tell(), "length": len(block)}
+            output.write(block)
+            output.write(b"\0" * layout.padding(len(block)))
+
+        footer = json.dumps({
+            "profile_name": data.profile_name,
+            "profile_url": data.profile_url,
+            "comments_status": data.comments_status.value,
+            "rows": len(comments),
+            "authors": len(author_index),
+            "byteorder": sys.byteorder,
+            "columns": column_meta,
+        }, ensure_ascii=False).encode("utf-8")
+
+        footer_offset = output.tell()
+        output.write(footer)
+        output.write(layout.TRAILER.pack(footer_offset, len(footer), layout.MAGIC))
+
+        return output.getvalue()
@@ -4,9 +4,18 @@ import json
 
 from output.serializers.base import OutputSerializer
 from domain.scrape_result import ScrapeResult
+from domain.analytics_report import AnalyticsReport
 
 class JSONSerializer(OutputSerializer):
     
     @staticmethod
     def serialize(data: ScrapeResult) -> str:
-        return json.dumps(asdict(data), default=lambda o: o.value if isinstance(o, Enum) else str(o), indent=4, ensure_ascii=False)
\ No newline at end of file
+        payload = asdict(data)
+        if payload["analytics"] is None:
+            del payload["analytics"]
+
+        return json.dumps(payload, default=lambda o: o.value if isinstance(o, Enum) else str(o), indent=4, ensure_ascii=False)
+
+    @staticmethod
+    def serialize_analytics(report: AnalyticsReport) -> str:
+        return json.dumps(asdict(report), indent=4, ensure_ascii=False)
\ No newline at end of file
@@ -2,6 +2,7 @@ from datetime import datetime
 
 from output.serializers.base import OutputSerializer
 from domain.scrape_result import ScrapeResult
+from domain.analytics_report import AnalyticsReport
 
 class TextSerializer(OutputSerializer):
 
@@ -22,5 +23,47 @@ class TextSerializer(OutputSerializer):
             lines.append(
                 f"At {datetime.fromtimestamp(comment.timestamp)} user named {comment.author_name} commented: {comment.text}"
                 )
+
+        if data.analytics:
+            lines.extend(TextSerializer._analytics_lines(data.analytics))
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
+
+    @staticmethod
+    def serialize_analytics(report: AnalyticsReport) -> str:
+        """
+        Convert an AnalyticsReport on its own into a plain text representation.
+        """
+
+        lines = [f"Total Comments: {report.total_comments}"]
+        lines.extend(TextSerializer._analytics_lines(report))
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _analytics_lines(analytics: AnalyticsReport) -> list[str]:
+        lines = [
+            "Analytics:",
+            f"Unique Authors: {analytics.unique_authors}",
+            "Top Authors:",
+        ]
+        lines.extend(f"  {author.author_name}: {author.comments}" for author in analytics.top_authors)
+
+        lines.append(f"Activity ({analytics.bucket_seconds}s buckets):")
+        lines.extend(
+            f"  {datetime.fromtimestamp(bucket.start_timestamp)}: {bucket.comments}" for bucket in analytics.histogram
+            )
+
+        lines.append("Bursts:")
+        lines.extend(
+            f"  {datetime.fromtimestamp(burst.start_timestamp)} - {datetime.fromtimestamp(burst.end_timestamp)}: {burst.comments} comments"
+            for burst in analytics.bursts
+            )
+
+        if analytics.gaps:
+            lines.append(
+                f"Time Between Comments: min {analytics.gaps.min_seconds}s, max {analytics.gaps.max_seconds}s, "
+                f"mean {analytics.gaps.mean_seconds:.0f}s, median {analytics.gaps.median_seconds:.0f}s"
+                )
+
+        return lines
\ No newline at end of file
@@ -3,6 +3,7 @@ from xml.dom import minidom
 
 from output.serializers.base import OutputSerializer
 from domain.scrape_result import ScrapeResult
+from domain.analytics_report import AnalyticsReport
 
 class XMLSerializer(OutputSerializer):
     
@@ -24,8 +25,55 @@ class XMLSerializer(OutputSerializer):
             ET.SubElement(comment_element, "Text").text = comment.text
             ET.SubElement(comment_element, "Timestamp").text = str(comment.timestamp)
 
+        if data.analytics:
+            XMLSerializer._append_analytics(root, data.analytics)
+
         return XMLSerializer._prettify(root)
+
+    @staticmethod
+    def serialize_analytics(report: AnalyticsReport) -> str:
+        return XMLSerializer._prettify(XMLSerializer._analytics_element(report))
     
+    @staticmethod
+    def _append_analytics(root: ET.Element, analytics: AnalyticsReport) -> None:
+        root.append(XMLSerializer._analytics_element(analytics))
+
+    @staticmethod
+    def _analytics_element(analytics: AnalyticsReport) -> ET.Element:
+        element = ET.Element("Analytics")
+        ET.SubElement(element, "TotalComments").text = str(analytics.total_comments)
+        ET.SubElement(element, "UniqueAuthors").text = str(analytics.unique_authors)
+        ET.SubElement(element, "FirstTimestamp").text = "" if analytics.first_timestamp is None else str(analytics.first_timestamp)
+        ET.SubElement(element, "LastTimestamp").text = "" if analytics.last_timestamp is None else str(analytics.last_timestamp)
+
+        top_authors = ET.SubElement(element, "TopAuthors")
+        for author in analytics.top_authors:
+            author_element = ET.SubElement(top_authors, "Author")
+            ET.SubElement(author_element, "AuthorName").text = author.author_name
+            ET.SubElement(author_element, "Comments").text = str(author.comments)
+
+        histogram = ET.SubElement(element, "Histogram", BucketSeconds=str(analytics.bucket_seconds))
+        for bucket in analytics.histogram:
+            bucket_element = ET.SubElement(histogram, "Bucket")
+            ET.SubElement(bucket_element, "StartTimestamp").text = str(bucket.start_timestamp)
+            ET.SubElement(bucket_element, "Comments").text = str(bucket.comments)
+
+        bursts = ET.SubElement(element, "Bursts")
+        for burst in analytics.bursts:
+            burst_element = ET.SubElement(bursts, "Burst")
+            ET.SubElement(burst_element, "StartTimestamp").text = str(burst.start_timestamp)
+            ET.SubElement(burst_element, "EndTimestamp").text = str(burst.end_timestamp)
+            ET.SubElement(burst_element, "Comments").text = str(burst.comments)
+
+        if analytics.gaps:
+            gaps = ET.SubElement(element, "Gaps")
+            ET.SubElement(gaps, "MinSeconds").text = str(analytics.gaps.min_seconds)
+            ET.SubElement(gaps, "MaxSeconds").text = str(analytics.gaps.max_seconds)
+            ET.SubElement(gaps, "MeanSeconds").text = f"{analytics.gaps.mean_seconds:.2f}"
+            ET.SubElement(gaps, "MedianSeconds").text = f"{analytics.gaps.median_seconds:.2f}"
+
+        return element
+
     @staticmethod
     def _prettify(element: ET.Element) -> str:
         rough_string = ET.tostring(element, 'unicode')
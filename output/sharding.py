@@ -0,0 +1,79 @@
+import os
+from dataclasses import dataclass
+
+from domain.comment import Comment
+
+@dataclass(frozen=True)
+class ShardInfo:
+    path: str
+    rows: int
+    bytes: int
+    sha256: str
+
+class Sharder:
+    # Rough per-row overhead of the serialized formats (keys, markup, timestamp).
+    _ROW_OVERHEAD_BYTES = 64
+    _FORMAT_SUFFIXES = (".json", ".csv", ".xml", ".txt", ".text", ".stc")
+    _COMPRESSION_SUFFIXES = (".gz", ".gzip", ".zst", ".zstd")
+
+    @staticmethod
+    def split(comments: list[Comment], max_comments: int = 0, max_bytes: int = 0) -> list[list[Comment]]:
+        """
+        Split comments into consecutive shards.
+
+        :param max_comments: int - maximum comments per shard, 0 disables the limit
+        :param max_bytes: int - approximate maximum uncompressed bytes per shard, 0 disables the limit
+        """
+        shards: list[list[Comment]] = []
+        current: list[Comment] = []
+        current_bytes = 0
+
+        for comment in comments:
+            row_bytes = Sharder.estimate_size(comment)
+            full_by_count = max_comments and len(current) >= max_comments
+            full_by_bytes = max_bytes and current and current_bytes + row_bytes > max_bytes
+
+            if full_by_count or full_by_bytes:
+                shards.append(current)
+                current, current_bytes = [], 0
+
+            current.append(comment)
+            current_bytes += row_bytes
+
+        if current or not shards:
+            shards.append(current)
+
+        return shards
+
+    @staticmethod
+    def estimate_size(comment: Comment) -> int:
+        return len(comment.author_name.encode("utf-8")) + len(comment.text.encode("utf-8")) + Sharder._ROW_OVERHEAD_BYTES
+
+    @staticmethod
+    def shard_path(path: str, index: int) -> str:
+        """
+        Insert the shard number before the format extension, keeping any
+        compression extension last: data.json.gz -> data.part-00001.json.gz
+        """
+        stem, suffix = Sharder._split_suffix(path)
+        return f"{stem}.part-{index:05d}{suffix}"
+
+    @staticmethod
+    def manifest_path(path: str) -> str:
+        stem, _ = Sharder._split_suffix(path)
+        return f"{stem}.manifest.json"
+
+    @staticmethod
+    def _split_suffix(path: str) -> tuple[str, str]:
+        """
+        Split the path into a stem and its known format and compression suffixes,
+        leaving any other dots in the file name as part of the stem.
+        """
+        stem, suffix = path, ""
+
+        for known in (Sharder._COMPRESSION_SUFFIXES, Sharder._FORMAT_SUFFIXES):
+            base, extension = os.path.splitext(stem)
+            if extension.lower() in known and os.path.basename(base):
+                stem, suffix = base, extension + suffix
+
+        return stem, suffix
@@ -0,0 +1,101 @@
+import logging
+from copy import deepcopy
+from time import time
+
+from config.env import EnvConfig
+from cli.dry_run import DryRunManager
+from services.comment_loader import CommentLoader
+from services.recrawl_scheduler import RecrawlScheduler, CrawlPlanEntry
+from steam_client.rate_limiter import RateLimiter
+from steam_client.steam_client import SteamClient
+from steam_client.exceptions import SteamRequestFailed
+from storage.comment_store import CommentStore
+from storage.crawl_history import CrawlHistory
+from storage.run_stats_file import RunStatsFile
+from services.run_estimator import RunEstimator
+from domain.run_stats import ProfileRunStats
+
+class BatchCrawler:
+    """
+    Crawls a list of profiles in the order planned by the RecrawlScheduler,
+    storing comments and updating per-profile crawl history.
+
+    A dry run only calls plan, which reads the crawl history; the store may
+    then be None.
+    """
+
+    def __init__(
+            self, env: EnvConfig, dry_run_manager: DryRunManager, scheduler: RecrawlScheduler,
+            history: CrawlHistory, store: CommentStore | None, logger: logging.Logger,
+            run_stats: RunStatsFile | None = None
+            ) -> None:
+        self._env = env
+        self._dry_run_manager = dry_run_manager
+        self._scheduler = scheduler
+        self._history = history
+        self._store = store
+        self._run_stats = run_stats
+        self._rate_limiter = RateLimiter(env.request_delay_ms)
+        self.logger = logger
+
+    def plan(self, profile_urls: list[str], now: int | None = None) -> list[CrawlPlanEntry]:
+        now = int(time()) if now is None else now
+        urls = [SteamClient.normalize_profile_url(url) for url in profile_urls]
+        return self._scheduler.plan([self._history.get(url) for url in urls], now)
+
+    def run(self, profile_urls: list[str]) -> int:
+        """
+        Crawl the planned profiles. Returns the number of requests spent.
+        """
+        plan = self.plan(profile_urls)
+        self.logger.info(f"{len(plan)} of {len(profile_urls)} profiles are due within the request budget.")
+        stats = self._run_stats.load() if self._run_stats else {}
+        spent = 0
+
+        try:
+            for entry in plan:
+                remaining = self._scheduler.request_budget - spent
+                if entry.estimated_requests > remaining:
+                    self.logger.info(f"Request budget of {self._scheduler.request_budget} reached, stopping.")
+                    break
+
+                spent += self._crawl(entry, stats, remaining)
+        finally:
+            if self._run_stats:
+                self._run_stats.save(stats)
+
+        return spent
+
+    def _crawl(self, entry: CrawlPlanEntry, stats: dict[str, ProfileRunStats], max_requests: int) -> int:
+        profile_env = deepcopy(self._env)
+        profile_env.steam_url = entry.profile_url
+        loader = CommentLoader(profile_env, self._dry_run_manager, self._rate_limiter)
+        history = self._history.get(entry.profile_url)
+
+        try:
+            result = loader.load_all(stop_at_timestamp=entry.stop_at_timestamp, max_requests=max_requests)
+        except SteamRequestFailed as e:
+            requests = loader.transfer_stats.requests
+            self.logger.warning(f"Crawling '{entry.profile_url}' failed: {e}")
+            self._history.save(self._scheduler.record_failure(history, requests, int(time())))
+            return requests
+
+        requests = loader.transfer_stats.requests
+        inserted = self._store.store(result)
+
+        if loader.truncated:
+            # Older comments were not reached, so the history is kept and the next run resumes from it.
+            self.logger.info(
+                f"Crawling '{entry.profile_url}' was cut short by the request budget: "
+                f"{inserted} new comments, {requests} requests."
+            )
+            return requests
+
+        RunEstimator.record_run(
+            stats, loader.transfer_stats, result, incremental=entry.stop_at_timestamp is not None
+        )
+        timestamps = [comment.timestamp for comment in result.account_comments]
+        self._history.save(self._scheduler.record_success(history, timestamps, requests, int(time())))
+        self.logger.info(f"Crawled '{entry.profile_url}': {inserted} new comments, {requests} requests.")
+
+        return requests
@@ -0,0 +1,125 @@
+from array import array
+from collections import Counter
+from statistics import median
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from domain.analytics_report import AnalyticsReport, AuthorCount, HistogramBucket, Burst, GapStats
+from domain.scrape_result import ScrapeResult
+from output.columnar_reader import ColumnarReader
+
+class CommentAnalytics:
+    """
+    Batch analytics over comment columns.
+
+    Works on a timestamps column and a dictionary-encoded authors column,
+    using NumPy when it is installed and plain Python otherwise. The columns
+    are copied, so a ColumnarReader can be closed while the object is alive.
+    """
+
+    def __init__(self, timestamps: Sequence[int], author_ids: Sequence[int], authors: list[str]) -> None:
+        self._authors = authors
+
+        if np is not None:
+            self._author_ids = np.array(author_ids, dtype=np.int64)
+            self._sorted_timestamps = np.sort(np.asarray(timestamps, dtype=np.int64))
+        else:
+            self._author_ids = array("q", author_ids)
+            self._sorted_timestamps = sorted(timestamps)
+
+    @classmethod
+    def from_scrape_result(cls, result: ScrapeResult) -> "CommentAnalytics":
+        author_index: dict[str, int] = {}
+        author_ids = array("q")
+        timestamps = array("q")
+
+        for comment in result.account_comments:
+            author_ids.append(author_index.setdefault(comment.author_name, len(author_index)))
+            timestamps.append(comment.timestamp)
+
+        return cls(timestamps, author_ids, list(author_index))
+
+    @classmethod
+    def from_columnar(cls, reader: ColumnarReader) -> "CommentAnalytics":
+        return cls(reader.timestamps, reader.author_ids, reader.authors)
+
+    def report(
+            self, top_n: int = 10, bucket_seconds: int = 86400,
+            burst_gap_seconds: int = 300, burst_min_comments: int = 5
+            ) -> AnalyticsReport:
+        total = len(self._sorted_timestamps)
+
+        return AnalyticsReport(
+            total_comments=total,
+            unique_authors=len(self._authors),
+            first_timestamp=int(self._sorted_timestamps[0]) if total else None,
+            last_timestamp=int(self._sorted_timestamps[-1]) if total else None,
+            bucket_seconds=bucket_seconds,
+            top_authors=self.top_authors(top_n),
+            histogram=self.histogram(bucket_seconds),
+            bursts=self.bursts(burst_gap_seconds, burst_min_comments),
+            gaps=self.gaps(),
+        )
+
+    def top_authors(self, n: int = 10) -> list[AuthorCount]:
+        if np is not None:
+            counts = np.bincount(self._author_ids, minlength=len(self._authors))
+            order = np.argsort(-counts, kind="stable")[:n]
+            pairs = [(int(i), int(counts[i])) for i in order]
+        else:
+            pairs = Counter(self._author_ids).most_common(n)
+
+        return [AuthorCount(self._authors[i], count) for i, count in pairs if count]
+
+    def histogram(self, bucket_seconds: int = 86400) -> list[HistogramBucket]:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be a positive integer")
+
+        if np is not None:
+            starts = self._sorted_timestamps - self._sorted_timestamps % bucket_seconds
+            buckets, counts = np.unique(starts, return_counts=True)
+            pairs = zip(buckets.tolist(), counts.tolist())
+        else:
+            pairs = sorted(Counter(ts - ts % bucket_seconds for ts in self._sorted_timestamps).items())
+
+        return [HistogramBucket(start, count) for start, count in pairs]
+
+    def gaps(self) -> GapStats | None:
+        if len(self._sorted_timestamps) < 2:
+            return None
+
+        if np is not None:
+            diffs = np.diff(self._sorted_timestamps)
+            return GapStats(int(diffs.min()), int(diffs.max()), float(diffs.mean()), float(np.median(diffs)))
+
+        ts = self._sorted_timestamps
+        diffs = [b - a for a, b in zip(ts, ts[1:])]
+        return GapStats(min(diffs), max(diffs), sum(diffs) / len(diffs), float(median(diffs)))
+
+    def bursts(self, max_gap_seconds: int = 300, min_comments: int = 5) -> list[Burst]:
+        """
+        Find runs of comments where consecutive comments are at most
+        max_gap_seconds apart and the run holds at least min_comments.
+        """
+        ts = self._sorted_timestamps
+        if len(ts) == 0:
+            return []
+
+        if np is not None:
+            breaks = np.flatnonzero(np.diff(ts) > max_gap_seconds) + 1
+            starts = np.concatenate(([0], breaks)).tolist()
+            ends = np.concatenate((breaks, [len(ts)])).tolist()
+        else:
+            breaks = [i for i in range(1, len(ts)) if ts[i] - ts[i - 1] > max_gap_seconds]
+            starts = [0] + breaks
+            ends = breaks + [len(ts)]
+
+        return [
+            Burst(int(ts[start]), int(ts[end - 1]), end - start)
+            for start, end in zip(starts, ends)
+            if end - start >= min_comments
+        ]
@@ -4,19 +4,61 @@ from domain.comment_status import CommentStatus
 from config.env import EnvConfig
 from parsing.comments import CommentParser
 from parsing.user import UserParser
+from services.dedupe_index import DedupeIndex
 from steam_client.steam_client import SteamClient
+from steam_client.transfer_stats import TransferStats
+from steam_client.rate_limiter import RateLimiter
 from cli.dry_run import DryRunManager
 
 class CommentLoader:
-    def __init__(self, env: EnvConfig, dry_run_manager: DryRunManager) -> None:
+    def __init__(self, env: EnvConfig, dry_run_manager: DryRunManager, rate_limiter: RateLimiter | None = None) -> None:
         self._env: EnvConfig = env
-        self._steam_client: SteamClient = SteamClient(env, dry_run_manager)
+        self._steam_client: SteamClient = SteamClient(env, dry_run_manager, rate_limiter)
         self._dry_run_manager: DryRunManager = dry_run_manager
+        self._dedupe_index: DedupeIndex = DedupeIndex()
+        self._shifted_pages: int = 0
+        self._duplicates_dropped: int = 0
+        self._truncated: bool = False
 
-    def load_all(self) -> ScrapeResult:
+    @property
+    def transfer_stats(self) -> TransferStats:
+        return self._steam_client.transfer_stats
+
+    @property
+    def duplicates_dropped(self) -> int:
+        return self._duplicates_dropped
+
+    @property
+    def shifted_pages(self) -> int:
+        return self._shifted_pages
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Whether the last load_all stopped paginating because of its request limit.
+        """
+        return self._truncated
+
+    def load_all(self, stop_at_timestamp: int | None = None, max_requests: int | None = None) -> ScrapeResult:
+        """
+        Load comments page by page.
+
+        :param stop_at_timestamp: int - stop paginating after the first page reaching
+            comments at or before this timestamp, used for incremental recrawls
+        :param max_requests: int - upper bound on the requests sent, including the
+            re-fetch of page 1 for the profile name; must be at least 2
+        """
         extracted_comments: list[Comment] = []
+        self._dedupe_index = DedupeIndex()
+        self._shifted_pages = 0
+        self._duplicates_dropped = 0
+        self._truncated = False
 
-        for page in range(1, self._env.max_pagination_depth + 1):
+        max_pages: int = self._env.max_pagination_depth
+        if max_requests is not None:
+            max_pages = min(max_pages, max_requests - 1)
+
+        for page in range(1, max_pages + 1):
             page_content: bytes = self._dry_run_manager.execute(
                 f"Fetch comments page {page}", self._steam_client.fetch_comments_page, page
                 )
@@ -25,8 +67,27 @@ class CommentLoader:
             page_comments: list[Comment] = CommentParser.parse_comments(page_content)
             if not page_comments:
                 break
-            extracted_comments.extend(page_comments)
+
+            new_comments: list[Comment] = self._dedupe_index.add_all(page_comments)
+            if len(new_comments) < len(page_comments):
+                # Comments posted during the walk pushed already seen ones onto this page.
+                self._shifted_pages += 1
+            extracted_comments.extend(new_comments)
+
+            if stop_at_timestamp is not None and min(c.timestamp for c in page_comments) <= stop_at_timestamp:
+                break
+        else:
+            self._truncated = max_pages < self._env.max_pagination_depth
+
+        self._duplicates_dropped = self._dedupe_index.duplicates
+        # The catch-up gets whatever the pagination and the profile name re-fetch left of the limit.
+        spare_pages: int = self._env.max_pagination_depth
+        if max_requests is not None:
+            spare_pages = min(spare_pages, max_requests - 1 - page)
+        if self._shifted_pages and spare_pages > 0:
+            extracted_comments = self._load_new_comments(spare_pages) + extracted_comments
         
+        user_url: str = self._env.steam_url
         if page_content is None:
             comment_status: CommentStatus = CommentStatus.UNKNOWN
             user_name: str = "DryRun User"
@@ -34,6 +95,24 @@ class CommentLoader:
             comment_status:CommentStatus = CommentParser.determine_comment_status(page_content, self._env.cookies_enabled)
             page_content: bytes = self._steam_client.fetch_comments_page(1)
             user_name: str = UserParser.parse_user(page_content)
-            user_url: str = self._env.steam_url
 
-        return ScrapeResult(user_name, user_url, extracted_comments, comment_status)
\ No newline at end of file
+        return ScrapeResult(user_name, user_url, extracted_comments, comment_status)
+
+    def _load_new_comments(self, max_pages: int) -> list[Comment]:
+        """
+        Re-fetch pages from the top until reaching comments that are already
+        indexed, collecting comments posted while the pagination was running.
+        """
+        new_comments: list[Comment] = []
+
+        for page in range(1, max_pages + 1):
+            page_content: bytes = self._steam_client.fetch_comments_page(page)
+            page_comments: list[Comment] = CommentParser.parse_comments(page_content)
+
+            fresh: list[Comment] = self._dedupe_index.add_all(page_comments)
+            new_comments.extend(fresh)
+
+            if not page_comments or len(fresh) < len(page_comments):
+                break
+
+        return new_comments
@@ -0,0 +1,55 @@
+from hashlib import blake2b
+
+from domain.comment import Comment
+
+class DedupeIndex:
+    """
+    Set of comment fingerprints used to drop comments that are seen twice
+    while paginating.
+
+    A fingerprint is an 8-byte hash of (author, timestamp, text), so memory
+    stays small even for very large profiles.
+    """
+
+    def __init__(self) -> None:
+        self._seen: set[int] = set()
+        self._duplicates: int = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, comment: Comment) -> bool:
+        return self.fingerprint(comment) in self._seen
+
+    @property
+    def duplicates(self) -> int:
+        return self._duplicates
+
+    def add(self, comment: Comment) -> bool:
+        """
+        Add the comment to the index. Returns False if it was already present.
+        """
+        fingerprint = self.fingerprint(comment)
+
+        if fingerprint in self._seen:
+            self._duplicates += 1
+            return False
+
+        self._seen.add(fingerprint)
+        return True
+
+    def add_all(self, comments: list[Comment]) -> list[Comment]:
+        """
+        Add comments to the index and return only the ones not seen before.
+        """
+        return [comment for comment in comments if self.add(comment)]
+
+    @staticmethod
+    def fingerprint(comment: Comment) -> int:
+        digest = blake2b(digest_size=8)
+        digest.update(comment.author_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(comment.timestamp).encode("ascii"))
+        digest.update(b"\0")
+        digest.update(comment.text.encode("utf-8"))
+        return int.from_bytes(digest.digest(), "little", signed=True)
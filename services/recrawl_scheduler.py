@@ -0,0 +1,141 @@
+from dataclasses import dataclass, replace
+from math import ceil
+
+from domain.profile_history import ProfileHistory
+
+SECONDS_PER_DAY = 86400
+
+@dataclass(frozen=True)
+class CrawlPlanEntry:
+    profile_url: str
+    priority: float
+    estimated_requests: int
+    stop_at_timestamp: int | None
+
+class RecrawlScheduler:
+    """
+    Decides which profiles to crawl next and how often, from their observed
+    new-comment rate, within a global request budget.
+
+    Hot profiles get short recrawl intervals, dormant ones long intervals and
+    failing ones an exponential backoff.
+    """
+
+    COMMENTS_PER_PAGE = 50
+    # Weight of the latest observation in the exponentially averaged comment rate.
+    RATE_SMOOTHING = 0.5
+
+    def __init__(
+            self, request_budget: int, max_pages: int, min_interval_s: int = 3600,
+            max_interval_s: int = 30 * SECONDS_PER_DAY, target_new_comments: int = COMMENTS_PER_PAGE
+            ) -> None:
+        self._request_budget = request_budget
+        self._max_pages = max_pages
+        self._min_interval_s = min_interval_s
+        self._max_interval_s = max_interval_s
+        self._target_new_comments = target_new_comments
+
+    @property
+    def request_budget(self) -> int:
+        return self._request_budget
+
+    def next_due(self, history: ProfileHistory) -> int:
+        if history.last_attempt is None:
+            return 0
+
+        if history.consecutive_failures:
+            backoff = self._min_interval_s * 2 ** history.consecutive_failures
+            return history.last_attempt + min(backoff, self._max_interval_s)
+
+        return history.last_attempt + self.interval(history)
+
+    def interval(self, history: ProfileHistory) -> int:
+        """
+        Seconds until the profile is expected to have target_new_comments new comments.
+        """
+        if history.new_comments_per_day <= 0:
+            return self._max_interval_s
+
+        interval = self._target_new_comments / history.new_comments_per_day * SECONDS_PER_DAY
+        return int(min(max(interval, self._min_interval_s), self._max_interval_s))
+
+    def estimate_requests(self, history: ProfileHistory, now: int) -> int:
+        # One extra request is always spent re-fetching page 1 for the profile name.
+        if history.last_success is None or history.newest_timestamp is None:
+            return self._max_pages + 1
+
+        expected = self.expected_new_comments(history, now)
+        pages = min(ceil(expected / self.COMMENTS_PER_PAGE) + 1, self._max_pages)
+        return pages + 1
+
+    def expected_new_comments(self, history: ProfileHistory, now: int) -> float:
+        if history.last_success is None:
+            return float("inf")
+
+        return history.new_comments_per_day * (now - history.last_success) / SECONDS_PER_DAY
+
+    def plan(self, histories: list[ProfileHistory], now: int) -> list[CrawlPlanEntry]:
+        """
+        Order due profiles by expected new comments and keep those that fit the request budget.
+        """
+        due = [h for h in histories if self.next_due(h) <= now]
+        due.sort(key=lambda h: self._priority(h, now), reverse=True)
+
+        plan: list[CrawlPlanEntry] = []
+        remaining = self._request_budget
+
+        for history in due:
+            cost = self.estimate_requests(history, now)
+            if cost > remaining:
+                continue
+
+            remaining -= cost
+            plan.append(CrawlPlanEntry(
+                profile_url=history.profile_url,
+                priority=self._priority(history, now),
+                estimated_requests=cost,
+                stop_at_timestamp=history.newest_timestamp
+            ))
+
+        return plan
+
+    def record_success(self, history: ProfileHistory, timestamps: list[int], requests: int, now: int) -> ProfileHistory:
+        """
+        Update the history after a successful crawl that returned comments with the given timestamps.
+        """
+        if history.last_success is None:
+            # No previous crawl to compare with, estimate the rate from the comments' own timestamps.
+            recent = [ts for ts in timestamps if ts >= now - self._max_interval_s]
+            span = max(now - min(recent), self._min_interval_s) if recent else self._max_interval_s
+            rate = len(recent) / (span / SECONDS_PER_DAY)
+        else:
+            new_comments = sum(1 for ts in timestamps if ts > (history.newest_timestamp or 0))
+            elapsed_days = max(now - history.last_success, self._min_interval_s) / SECONDS_PER_DAY
+            observed = new_comments / elapsed_days
+            rate = self.RATE_SMOOTHING * observed + (1 - self.RATE_SMOOTHING) * history.new_comments_per_day
+
+        newest = max(timestamps, default=history.newest_timestamp)
+        if history.newest_timestamp is not None:
+            newest = max(newest, history.newest_timestamp)
+
+        return replace(
+            history,
+            last_attempt=now,
+            last_success=now,
+            newest_timestamp=newest,
+            new_comments_per_day=rate,
+            consecutive_failures=0,
+            requests_last_run=requests
+        )
+
+    def record_failure(self, history: ProfileHistory, requests: int, now: int) -> ProfileHistory:
+        return replace(
+            history,
+            last_attempt=now,
+            consecutive_failures=history.consecutive_failures + 1,
+            requests_last_run=requests
+        )
+
+    def _priority(self, history: ProfileHistory, now: int) -> float:
+        expected = self.expected_new_comments(history, now)
+        return expected / (1 + history.consecutive_failures)
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Collection
+
+from config.env import EnvConfig
+from domain.comment import Comment
+from domain.comment_status import CommentStatus
+from domain.run_stats import RunStats, ProfileRunStats
+from domain.scrape_result import ScrapeResult
+from output.output_format import OutputFormat
+from output.output_manager import OutputManager
+from services.recrawl_scheduler import RecrawlScheduler
+from steam_client.transfer_stats import TransferStats
+
+@dataclass(frozen=True)
+class RunEstimate:
+    planned_requests: int
+    expected_requests: int
+    expected_comments: int
+    seconds_per_request: float
+    expected_duration_s: float
+    concurrency: int
+    output_bytes: dict[OutputFormat, int]
+    profiles: int
+    profiles_with_history: int
+
+class RunEstimator:
+    """
+    Estimates request count, duration and output size of a run from the
+    rate limiter settings and, when available, per-profile statistics of
+    previous runs.
+    """
+
+    DEFAULT_LATENCY_S = 0.5
+    DEFAULT_TEXT_BYTES = 80
+    _SAMPLE_SIZE = 50
+
+    def __init__(self, env: EnvConfig, stats: dict[str, ProfileRunStats]) -> None:
+        self._env = env
+        self._stats = stats
+        # Latency and output sizes do not depend on the profile, pool them over all runs.
+        self._pooled = RunStats.total(
+            run_stats for profile in stats.values() for run_stats in (profile.full, profile.incremental)
+        )
+
+    def estimate(self, planned: dict[str, int], incremental: Collection[str] = (), concurrency: int = 1) -> RunEstimate:
+        """
+        :param planned: dict - upper bound of requests per normalized profile URL
+        :param incremental: Collection[str] - profiles planned as incremental recrawls,
+            estimated from previous recrawls instead of full crawls
+        :param concurrency: int - number of requests in flight at once; SteamClient
+            currently sends requests sequentially
+        """
+        expected_requests = 0
+        expected_comments = 0
+        with_history = 0
+
+        for profile_url, planned_requests in planned.items():
+            profile = self._stats.get(profile_url)
+            stats = profile.for_run(profile_url in incremental) if profile else None
+            requests, comments, known = self._estimate_profile(stats, planned_requests)
+            expected_requests += requests
+            expected_comments += comments
+            with_history += known
+
+        latency = self._pooled.average_latency or self.DEFAULT_LATENCY_S
+        # The rate limiter spaces request starts regardless of how many are in flight.
+        seconds_per_request = max(latency / max(concurrency, 1), self._env.request_delay_ms / 1000)
+
+        return RunEstimate(
+            planned_requests=sum(planned.values()),
+            expected_requests=expected_requests,
+            expected_comments=expected_comments,
+            seconds_per_request=seconds_per_request,
+            expected_duration_s=seconds_per_request * expected_requests,
+            concurrency=concurrency,
+            output_bytes={f: round(self.bytes_per_comment(f) * expected_comments) for f in OutputFormat},
+            profiles=len(planned),
+            profiles_with_history=with_history
+        )
+
+    def _estimate_profile(self, stats: RunStats | None, planned_requests: int) -> tuple[int, int, bool]:
+        if stats is None or not stats.runs:
+            # Every profile re-fetches its first page once for the profile name.
+            pages = max(planned_requests - 1, 0)
+            return planned_requests, pages * RecrawlScheduler.COMMENTS_PER_PAGE, False
+
+        expected_requests = min(planned_requests, round(stats.requests_per_run))
+        return expected_requests, round((stats.comments_per_request or 0) * expected_requests), True
+
+    def bytes_per_comment(self, output_format: OutputFormat) -> float:
+        recorded = self._pooled.bytes_per_comment(output_format.value)
+        if recorded is not None:
+            return recorded
+
+        # Nothing recorded for this format yet, measure a sample of typical comments.
+        text_bytes = round(self._pooled.average_text_bytes or self.DEFAULT_TEXT_BYTES)
+        sample = ScrapeResult(
+            profile_name="Sample",
+            profile_url=self._env.steam_url or "",
+            account_comments=[Comment("Sample Author", 1700000000 + i, "x" * text_bytes) for i in range(self._SAMPLE_SIZE)],
+            comments_status=CommentStatus.UNKNOWN
+        )
+        manager = OutputManager(format=output_format, measure_size=True)
+        manager.serialize(sample)
+        return manager.serialized_size / self._SAMPLE_SIZE
+
+    @staticmethod
+    def record_run(
+            stats: dict[str, ProfileRunStats], transfer_stats: TransferStats, result: ScrapeResult,
+            output_format: OutputFormat | None = None, serialized_size: int = 0, incremental: bool = False
+            ) -> dict[str, ProfileRunStats]:
+        """
+        Add a finished run to the stats of its profile. Batch crawls write no
+        output, so output_format is None for them.
+
+        :param incremental: bool - the run was a recrawl stopping at previously seen comments
+        """
+        profile_stats = stats.setdefault(result.profile_url, ProfileRunStats()).for_run(incremental)
+        comments = len(result.account_comments)
+
+        profile_stats.runs += 1
+        profile_stats.requests += transfer_stats.requests
+        profile_stats.request_seconds += transfer_stats.request_seconds
+        profile_stats.comments += comments
+        profile_stats.text_bytes += sum(len(comment.text.encode("utf-8")) for comment in result.account_comments)
+
+        if output_format is not None:
+            key = output_format.value
+            profile_stats.output_bytes[key] = profile_stats.output_bytes.get(key, 0) + serialized_size
+            profile_stats.output_comments[key] = profile_stats.output_comments.get(key, 0) + comments
+
+        return stats
@@ -0,0 +1,46 @@
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from steam_client.exceptions import SteamRequestFailed
+
+_DECODE_ERRORS = (zlib.error, ValueError) + ((brotli.error,) if brotli is not None else ())
+
+class ContentEncoding:
+    """
+    Explicit HTTP content-encoding negotiation and decoding.
+
+    Bodies are read undecoded from the wire so that both the transferred and
+    the decoded size can be measured.
+    """
+
+    @staticmethod
+    def accept_encoding() -> str:
+        if brotli is not None:
+            return "gzip, deflate, br"
+        return "gzip, deflate"
+
+    @staticmethod
+    def decode(body: bytes, encoding: str | None) -> bytes:
+        encoding = (encoding or "identity").strip().lower()
+
+        try:
+            match encoding:
+                case "identity" | "":
+                    return body
+                case "gzip" | "x-gzip":
+                    return zlib.decompress(body, zlib.MAX_WBITS | 16)
+                case "deflate":
+                    try:
+                        return zlib.decompress(body)
+                    except zlib.error:
+                        return zlib.decompress(body, -zlib.MAX_WBITS)
+                case "br" if brotli is not None:
+                    return brotli.decompress(body)
+                case _:
+                    raise SteamRequestFailed(f"Unsupported content encoding: {encoding}")
+        except _DECODE_ERRORS as e:
+            raise SteamRequestFailed(f"Failed to decode '{encoding}' response body") from e
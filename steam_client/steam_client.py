@@ -1,38 +1,74 @@
+from time import monotonic
+
 from requests import get, exceptions
 
 from config.env import EnvConfig
 from steam_client.rate_limiter import RateLimiter
+from steam_client.content_encoding import ContentEncoding
+from steam_client.transfer_stats import TransferStats
 from cli.dry_run import DryRunManager
 
 from steam_client.exceptions import SteamRequestFailed, MaxPaginationDepthExceeded
 
 class SteamClient:
-    def __init__(self, env: EnvConfig, dry_run_manager: DryRunManager) -> None:
+    def __init__(self, env: EnvConfig, dry_run_manager: DryRunManager, rate_limiter: RateLimiter | None = None) -> None:
         self._env = env
-        self._rate_limiter = RateLimiter(self._env.request_delay_ms)
-        if not self._env.steam_url.endswith("/allcomments"): self._env.steam_url += "/allcomments"
+        self._rate_limiter = rate_limiter or RateLimiter(self._env.request_delay_ms)
+        self._env.steam_url = self.normalize_profile_url(self._env.steam_url)
         self._dry_run_manager: DryRunManager = dry_run_manager
+        self._transfer_stats: TransferStats = TransferStats()
     
     def fetch_comments_page(self, page: int) -> bytes:
         return self._dry_run_manager.execute(f"Fetch comments page {page}", self._fetch_comments_page, page)
 
+    @property
+    def transfer_stats(self) -> TransferStats:
+        return self._transfer_stats
+
+    @staticmethod
+    def normalize_profile_url(url: str) -> str:
+        """
+        Canonical form of a profile URL, pointing at its comments page. Used as
+        the profile key by the comment store and crawl history.
+        """
+        url = url.strip().rstrip("/")
+        return url if url.endswith("/allcomments") else url + "/allcomments"
+
     def _fetch_comments_page(self, page: int) -> bytes:
         if page > self._env.max_pagination_depth:
             raise MaxPaginationDepthExceeded(f"Max pagination depth of {self._env.max_pagination_depth} exceeded")
 
         self._rate_limiter.wait()
+        response = None
+        started = monotonic()
         
         try:
             response = get(
                 f"{self._env.steam_url}?ctp={page}",
-                cookies=self._env.cookies
+                cookies=self._env.cookies,
+                headers={"Accept-Encoding": ContentEncoding.accept_encoding()},
+                stream=True
             )
             response.raise_for_status()
+            raw_body: bytes = response.raw.read(decode_content=False)
+            elapsed = monotonic() - started
         except exceptions.HTTPError as e:
+            self._transfer_stats.record_failure(monotonic() - started)
             raise SteamRequestFailed(f"HTTP {e.response.status_code}") from e
         except exceptions.RequestException as e:
+            self._transfer_stats.record_failure(monotonic() - started)
             raise SteamRequestFailed("Network error") from e
         except Exception as e:
+            self._transfer_stats.record_failure(monotonic() - started)
             raise SteamRequestFailed("Unknown error") from e
-        
-        return response.content
\ No newline at end of file
+        finally:
+            if response is not None: response.close()
+
+        try:
+            content: bytes = ContentEncoding.decode(raw_body, response.headers.get("Content-Encoding"))
+        except SteamRequestFailed:
+            self._transfer_stats.record_failure(elapsed, len(raw_body))
+            raise
+        self._transfer_stats.record(len(raw_body), len(content), elapsed)
+
+        return content
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+@dataclass
+class TransferStats:
+    requests: int = 0
+    compressed_bytes: int = 0
+    decompressed_bytes: int = 0
+    request_seconds: float = 0.0
+    failed_requests: int = 0
+
+    def record(self, compressed: int, decompressed: int, seconds: float = 0.0) -> None:
+        self.requests += 1
+        self.compressed_bytes += compressed
+        self.decompressed_bytes += decompressed
+        self.request_seconds += seconds
+
+    def record_failure(self, seconds: float = 0.0, compressed: int = 0) -> None:
+        self.requests += 1
+        self.failed_requests += 1
+        self.compressed_bytes += compressed
+        self.request_seconds += seconds
+
+    @property
+    def average_latency(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.request_seconds / self.requests
+
+    @property
+    def compression_ratio(self) -> float:
+        if not self.compressed_bytes:
+            return 1.0
+        return self.decompressed_bytes / self.compressed_bytes
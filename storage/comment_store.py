@@ -0,0 +1,193 @@
+import sqlite3
+from time import time
+
+from domain.comment import Comment
+from domain.scrape_result import ScrapeResult
+from domain.stored_comment import StoredComment
+from services.dedupe_index import DedupeIndex
+from storage.exceptions import StoreError
+
+class CommentStore:
+    """
+    Persistent SQLite store of scraped comments across profiles.
+
+    Comments are indexed by author and timestamp, and their text by an FTS5
+    trigram index when the SQLite build supports it (3.34+). Text search is a
+    case-insensitive substring match with or without the index.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            id INTEGER PRIMARY KEY,
+            profile_url TEXT NOT NULL UNIQUE,
+            profile_name TEXT,
+            comments_status TEXT,
+            last_scraped INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS comments (
+            id INTEGER PRIMARY KEY,
+            profile_id INTEGER NOT NULL REFERENCES profiles(id),
+            fingerprint INTEGER NOT NULL,
+            author_name TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            UNIQUE (profile_id, fingerprint)
+        );
+        CREATE INDEX IF NOT EXISTS idx_comments_author ON comments (author_name, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_comments_timestamp ON comments (timestamp);
+    """
+    _FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5 (
+            text, content='comments', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS comments_fts_insert AFTER INSERT ON comments BEGIN
+            INSERT INTO comments_fts (rowid, text) VALUES (new.id, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS comments_fts_delete AFTER DELETE ON comments BEGIN
+            INSERT INTO comments_fts (comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        END;
+    """
+    _FTS_DROP = """
+        DROP TRIGGER IF EXISTS comments_fts_insert;
+        DROP TRIGGER IF EXISTS comments_fts_delete;
+        DROP TABLE IF EXISTS comments_fts;
+    """
+    # Trigram indexes cannot match shorter text, these fall back to LIKE.
+    _FTS_MIN_QUERY_LENGTH = 3
+
+    def __init__(self, path: str, batch_size: int = 1000) -> None:
+        self._path = path
+        self._batch_size = batch_size
+
+        try:
+            self._connection = sqlite3.connect(path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(self._SCHEMA)
+            self._fts_enabled = self._create_fts()
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to open comment store at '{path}'") from e
+
+    def __enter__(self) -> "CommentStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def fts_enabled(self) -> bool:
+        return self._fts_enabled
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def store(self, result: ScrapeResult) -> int:
+        """
+        Bulk-insert the comments of a scrape result. Comments already stored
+        for the profile are skipped. Returns the number of inserted comments.
+        """
+        comments = result.account_comments
+        inserted = 0
+
+        try:
+            with self._connection:
+                profile_id = self._upsert_profile(result)
+
+            for start in range(0, len(comments), self._batch_size):
+                rows = [
+                    (profile_id, DedupeIndex.fingerprint(c), c.author_name, c.timestamp, c.text)
+                    for c in comments[start:start + self._batch_size]
+                ]
+                with self._connection:
+                    cursor = self._connection.executemany(
+                        "INSERT OR IGNORE INTO comments (profile_id, fingerprint, author_name, timestamp, text) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    inserted += cursor.rowcount
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to store comments in '{self._path}'") from e
+
+        return inserted
+
+    def search(
+            self, author: str | None = None, text: str | None = None, since: int | None = None,
+            until: int | None = None, profile_url: str | None = None, limit: int | None = None
+            ) -> list[StoredComment]:
+        """
+        Find stored comments matching all given filters, newest first.
+
+        :param text: str - text the comment must contain, case-insensitive
+        :param since: int - inclusive lower bound on the unix timestamp
+        :param until: int - exclusive upper bound on the unix timestamp
+        """
+        conditions: list[str] = []
+        params: list = []
+
+        if author is not None:
+            conditions.append("c.author_name = ?")
+            params.append(author)
+        if since is not None:
+            conditions.append("c.timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("c.timestamp < ?")
+            params.append(until)
+        if profile_url is not None:
+            conditions.append("p.profile_url = ?")
+            params.append(profile_url)
+        if text is not None:
+            if self._fts_enabled and len(text) >= self._FTS_MIN_QUERY_LENGTH:
+                conditions.append("c.id IN (SELECT rowid FROM comments_fts WHERE comments_fts MATCH ?)")
+                params.append('"' + text.replace('"', '""') + '"')
+            else:
+                conditions.append("c.text LIKE ? ESCAPE '\\'")
+                params.append("%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+
+        query = (
+            "SELECT p.profile_url, c.author_name, c.timestamp, c.text "
+            "FROM comments c JOIN profiles p ON p.id = c.profile_id"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY c.timestamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        try:
+            rows = self._connection.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to query comment store '{self._path}'") from e
+
+        return [StoredComment(url, Comment(author_name, timestamp, body)) for url, author_name, timestamp, body in rows]
+
+    def _upsert_profile(self, result: ScrapeResult) -> int:
+        self._connection.execute(
+            "INSERT INTO profiles (profile_url, profile_name, comments_status, last_scraped) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (profile_url) DO UPDATE SET profile_name = excluded.profile_name, "
+            "comments_status = excluded.comments_status, last_scraped = excluded.last_scraped",
+            (result.profile_url, result.profile_name, result.comments_status.value, int(time()))
+        )
+        row = self._connection.execute("SELECT id FROM profiles WHERE profile_url = ?", (result.profile_url,)).fetchone()
+        return row[0]
+
+    def _create_fts(self) -> bool:
+        row = self._connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'comments_fts'"
+        ).fetchone()
+        existed = row is not None
+
+        try:
+            if existed and "trigram" not in row[0]:
+                # Stores created before the trigram index matched whole tokens only.
+                self._connection.executescript(self._FTS_DROP)
+                existed = False
+            self._connection.executescript(self._FTS_SCHEMA)
+            if not existed:
+                # The store may already hold comments, e.g. written by a SQLite build without FTS5.
+                with self._connection:
+                    self._connection.execute("INSERT INTO comments_fts (comments_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            return False
@@ -0,0 +1,84 @@
+import os
+import sqlite3
+from dataclasses import astuple
+
+from domain.profile_history import ProfileHistory
+from storage.exceptions import StoreError
+
+class CrawlHistory:
+    """
+    Per-profile crawl history, kept in the same SQLite file as the comment store.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS crawl_history (
+            profile_url TEXT PRIMARY KEY,
+            last_attempt INTEGER,
+            last_success INTEGER,
+            newest_timestamp INTEGER,
+            new_comments_per_day REAL NOT NULL DEFAULT 0,
+            consecutive_failures INTEGER NOT NULL DEFAULT 0,
+            requests_last_run INTEGER NOT NULL DEFAULT 0
+        );
+    """
+    _COLUMNS = (
+        "profile_url", "last_attempt", "last_success", "newest_timestamp",
+        "new_comments_per_day", "consecutive_failures", "requests_last_run"
+    )
+
+    def __init__(self, path: str, read_only: bool = False) -> None:
+        """
+        :param read_only: bool - open without creating the file or schema; a missing
+            file or table reads as an empty history
+        """
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+
+        try:
+            if not read_only:
+                self._connection = sqlite3.connect(path)
+                self._connection.executescript(self._SCHEMA)
+            elif os.path.exists(path):
+                self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                if not self._connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'crawl_history'"
+                ).fetchone():
+                    self.close()
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to open crawl history at '{path}'") from e
+
+    def __enter__(self) -> "CrawlHistory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get(self, profile_url: str) -> ProfileHistory:
+        if self._connection is None:
+            return ProfileHistory(profile_url)
+
+        try:
+            row = self._connection.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM crawl_history WHERE profile_url = ?", (profile_url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to read crawl history from '{self._path}'") from e
+
+        return ProfileHistory(*row) if row else ProfileHistory(profile_url)
+
+    def save(self, history: ProfileHistory) -> None:
+        placeholders = ", ".join("?" for _ in self._COLUMNS)
+
+        try:
+            with self._connection:
+                self._connection.execute(
+                    f"INSERT OR REPLACE INTO crawl_history ({', '.join(self._COLUMNS)}) VALUES ({placeholders})",
+                    astuple(history)
+                )
+        except sqlite3.Error as e:
+            raise StoreError(f"Failed to save crawl history to '{self._path}'") from e
@@ -0,0 +1,34 @@
+import json
+from dataclasses import asdict
+
+from domain.run_stats import RunStats, ProfileRunStats
+from storage.exceptions import StoreError
+
+class RunStatsFile:
+    """
+    JSON file accumulating statistics of previous runs per profile URL, used
+    for dry-run estimates.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def load(self) -> dict[str, ProfileRunStats]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {
+                url: ProfileRunStats(full=RunStats(**stats["full"]), incremental=RunStats(**stats["incremental"]))
+                for url, stats in raw["profiles"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            raise StoreError(f"Failed to read run stats from '{self._path}'") from e
+
+    def save(self, stats: dict[str, ProfileRunStats]) -> None:
+        try:
+            with open(self._path, "w", encoding="utf-8") as f:
+                json.dump({"profiles": {url: asdict(s) for url, s in stats.items()}}, f, indent=4)
+        except OSError as e:
+            raise StoreError(f"Failed to write run stats to '{self._path}'") from e